@@ -1,6 +1,11 @@
 '''
 Custom parser to bind the command-line arguments to the dataclass.
 '''
+import sys
+
+if sys.version_info < (3, 8):
+    raise RuntimeError('parser-binding requires Python 3.8 or later.')
+
 from .parser import BindingParser, ComamndLineParser, parse_args
 from .types import BindingField
 
@@ -1,13 +1,81 @@
 '''
 A custom ArgumentParser to analysis fields from the dataclass and construct the options for command-line.
 '''
-import time
-from argparse import Action, ArgumentError, ArgumentParser, FileType, HelpFormatter
-from dataclasses import dataclass, fields
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, overload
+import sys
+from argparse import (
+    SUPPRESS,
+    Action,
+    ArgumentError,
+    ArgumentParser,
+    FileType,
+    HelpFormatter,
+    Namespace,
+    _HelpAction,
+    _StoreAction,
+    _StoreFalseAction,
+    _StoreTrueAction,
+)
+from dataclasses import dataclass, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union, overload
+
+from .types import (
+    BindingType,
+    DataclassType,
+)
+from .utils import (
+    _WRAPPER_CLS,
+    analysis_dataclass,
+    dataclass_fields,
+)
+
+_MISSING = object()
+
+# The actions can be parsed by `BindingParser._fast_parse_args`.
+_FAST_PARSE_ACTIONS = frozenset(
+    {_StoreAction, _StoreTrueAction, _StoreFalseAction, _HelpAction}
+)
+
+
+def _convert_collection(arg_val: Any, field: BindingType) -> Any:
+    '''
+        Convert the parsed value to the collection type of the field, the value is
+        returned as is if the field is not a collection or the value is None.
+    '''
+    converter = _WRAPPER_CLS.get(field.wrapper_type)
+    if converter is None or arg_val is None:
+        return arg_val
+
+    return converter(arg_val)
+
 
-from .types import DataclassType, DataWrapperType, FileTypeWithGzip
-from .utils import analysis_dataclass, dequeue_wrapper, queue_wrapper
+def _build_binding_fields(
+    cls: Type[DataclassType], field_info: Mapping[str, BindingType]
+) -> Tuple[Tuple[str, BindingType], ...]:
+    '''
+        Build the `(name, BindingType)` pairs of a dataclass, so that binding the
+        parsed arguments to the dataclass does not need to call `fields()` and
+        look up the field information again on every parse.
+    '''
+    return tuple(
+        (sys.intern(f.name), field_info[f.name])
+        for f in dataclass_fields(cls)
+        if f.name in field_info
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_merged_dataclass(
+    types: Tuple[Type[DataclassType], ...]
+) -> Type[DataclassType]:
+    '''
+        Build the dataclass merging all the given dataclasses.
+
+        The merged class is memoized per `types`, so parsing into the same
+        dataclasses repeatedly does not create and decorate a new class each time.
+        The binding fields depend on the parser, they are not attached here.
+    '''
+    return dataclass(type('_MergedDataClass', types, {}))
 
 
 class BindingParser(ArgumentParser):
@@ -18,6 +86,9 @@ class BindingParser(ArgumentParser):
 
         Parameters:
         - clz (`iterable[type]`): The type of the data class to which the parsed arguments will be bound.
+        - fast_parse (`bool`, optional): Whether to parse the simple command-lines without the full argparse
+            machinery, default False. It only applies when all the options take a single value or are switches,
+            anything else (e.g. `-h`, abbreviations, invalid values) falls back to argparse.
 
         Example:
         ```python
@@ -53,16 +124,21 @@ class BindingParser(ArgumentParser):
         argument_default: Any = None,
         conflict_handler: str = "error",
         add_help: bool = True,
-        allow_abbrev: bool = True
+        allow_abbrev: bool = True,
+        fast_parse: bool = False
     ) -> None:
         super(BindingParser, self).__init__(
             prog, usage, description, epilog, parents, formatter_class,
             prefix_chars, fromfile_prefix_chars, argument_default,
             conflict_handler, add_help, allow_abbrev
         )
-        self._dataclasses = list(clz)
+        self._dataclasses = []
+        self._field_info = {}
+        # The `(name, BindingType)` pairs of the dataclasses bound by this parser.
+        self._binding_fields = {}
+        self._fast_parse = fast_parse
 
-        self.parse_dataclasses()
+        self.parse_dataclasses(clz)
 
     def parse_dataclasses(
         self, dataclasses: Optional[Sequence[Type[DataclassType]]] = None
@@ -72,6 +148,7 @@ class BindingParser(ArgumentParser):
 
             This method allows parsing the fields of one or more data classes into the argument parser.
             If no specific data classes are provided, it will use the data classes defined in the parser.
+            The data classes already bound with the parser are skipped.
 
             Parameters:
             - dataclasses (`Optional[Sequence[Type[DataclassType]]]`): 
@@ -98,70 +175,40 @@ class BindingParser(ArgumentParser):
             parser.parse_dataclasses()
             ```
         '''
-        if dataclasses is not None:
-            if dataclasses not in self._dataclasses:
-                res = analysis_dataclass(*dataclasses)
-        else:
-            res = analysis_dataclass(*self._dataclasses)
-        self._field_info = res
+        if dataclasses is None:
+            dataclasses = self._dataclasses
+        dataclasses = [
+            cls for cls in dict.fromkeys(dataclasses)
+            if cls not in self._dataclasses
+        ]
+        self._dataclasses.extend(dataclasses)
+        res = analysis_dataclass(*dataclasses)
+        self._field_info.update(res)
         for name, _type in res.items():
-            kwargs = {
-                'action':
-                _type.action,
-                'nargs':
-                '*' if _type.multiple and _type.seperator is None else None,
-                'default':
-                _type.default,
-                'type':
-                _type.type,
-                'choices':
-                _type.choices
-                if not callable(_type.choices) else _type.choices(),
-                'help':
-                ' '.join((_type.help, _type.help_suffix)),
-                'required':
-                _type.required
-            }
-            if _type.is_switch:
-                for k in ('nargs', 'type', 'choices'):
-                    kwargs.pop(k)
-            if _type.wrapper_type is DataWrapperType.File or _type.file:
-                kwargs['type'] = FileTypeWithGzip(
-                    mode=_type.file_mode,
-                    encoding=_type.file_encoding,
-                    content_type=_type.type
-                )
-                kwargs['default'] = _type.default_file
-                for k in ('nargs', 'choices', 'action'):
-                    kwargs.pop(k)
-            if _type.required:
-                kwargs.pop('default')
-            self.add_argument(*_type.options, **kwargs, dest=name)
+            kwargs = _type._add_argument_spec
+            if callable(kwargs.get('choices')):
+                kwargs = dict(kwargs, choices=kwargs['choices']())
+            self.add_argument(*_type._options, dest=name, **kwargs)
+
+        # The field information may be overridden by the new dataclasses.
+        self._binding_fields = {
+            cls: _build_binding_fields(cls, self._field_info)
+            for cls in self._dataclasses
+            if is_dataclass(cls)
+        }
 
     def _init_dataclass_with_args(
         self, cls: Type[DataclassType], kwargs: Dict
     ) -> DataclassType:
-        all_fields = fields(cls)
-        init_kwargs = {}
-        for field in all_fields:
-            if field.name in kwargs:
-                arg_val = kwargs.pop(field.name)
-                field = self._field_info[field.name]
-                if arg_val is not None and DataWrapperType.is_basic_collection(
-                    field.wrapper_type
-                ):
-                    if field.wrapper_type is DataWrapperType.List:
-                        arg_val = list(arg_val)
-                    elif field.wrapper_type is DataWrapperType.Tuple:
-                        arg_val = tuple(arg_val)
-                    elif field.wrapper_type is DataWrapperType.Set:
-                        arg_val = set(arg_val)
-                    elif field.wrapper_type is DataWrapperType.Queue:
-                        arg_val = queue_wrapper(arg_val)
-                    elif field.wrapper_type is DataWrapperType.Dequeue:
-                        arg_val = dequeue_wrapper(arg_val)
-
-                init_kwargs[field.name] = arg_val
+        binding_fields = self._binding_fields.get(cls)
+        if binding_fields is None:
+            binding_fields = _build_binding_fields(cls, self._field_info)
+            self._binding_fields[cls] = binding_fields
+        init_kwargs = {
+            name: _convert_collection(arg_val, field)
+            for name, field in binding_fields
+            if (arg_val := kwargs.pop(name, _MISSING)) is not _MISSING
+        }
 
         return cls(**init_kwargs)
 
@@ -213,10 +260,7 @@ class BindingParser(ArgumentParser):
         arg_dict = vars(args)
         results = []
         if not split_classes:
-            _MergedDataClass = type(
-                f'_MergedDataClass@{int(time.time() * 1000)}', types, {}
-            )
-            _MergedDataClass = dataclass(_MergedDataClass)
+            _MergedDataClass = _build_merged_dataclass(tuple(types))
             item = self._init_dataclass_with_args(_MergedDataClass, arg_dict)
             return item
         else:
@@ -236,11 +280,104 @@ class BindingParser(ArgumentParser):
             Parameters:
             - cls (`Type[DataclassType]`): The type of the data class to be added to the parser.
         '''
-        self._dataclasses.append(cls)
         self.parse_dataclasses([cls])
 
         return cls
 
+    def parse_args(
+        self,
+        args: Optional[Sequence[str]] = None,
+        namespace: Optional[Namespace] = None
+    ) -> Namespace:
+        if self._fast_parse and namespace is None:
+            parsed = self._fast_parse_args(
+                sys.argv[1:] if args is None else list(args)
+            )
+            if parsed is not None:
+                return parsed
+
+        return super(BindingParser, self).parse_args(args, namespace)
+
+    def _fast_parse_args(self, args: List[str]) -> Optional[Namespace]:
+        '''
+            Parse the arguments in a single pass over the command-line.
+
+            Only the options storing a single value and the switches are supported, `None` is
+            returned whenever the arguments need the full argparse parsing, including the
+            help option, unknown or abbreviated options and the values failed to convert.
+        '''
+        if self.fromfile_prefix_chars is not None or self._mutually_exclusive_groups:
+            return None
+        for action in self._actions:
+            if type(action) not in _FAST_PARSE_ACTIONS or (
+                isinstance(action, _StoreAction) and (
+                    action.nargs is not None
+                    or isinstance(action.type, FileType)
+                )
+            ):
+                return None
+
+        option_actions = self._option_string_actions
+        prefix_chars = self.prefix_chars
+        # Seed the defaults as `parse_known_args` does, the first action with a
+        # `dest` wins, and the parser level defaults fill the rest.
+        namespace = Namespace()
+        for action in self._actions:
+            if action.dest is not SUPPRESS and action.default is not SUPPRESS:
+                if not hasattr(namespace, action.dest):
+                    setattr(namespace, action.dest, action.default)
+        for dest, value in self._defaults.items():
+            if not hasattr(namespace, dest):
+                setattr(namespace, dest, value)
+
+        seen_actions = set()
+        index, num_args = 0, len(args)
+        while index < num_args:
+            option_string, explicit_arg = args[index], None
+            index += 1
+            if option_string[:1] in prefix_chars and '=' in option_string:
+                option_string, explicit_arg = option_string.split('=', 1)
+            action = option_actions.get(option_string)
+            if action is None or isinstance(action, _HelpAction):
+                return None
+
+            if action.nargs == 0:
+                if explicit_arg is not None:
+                    return None
+                setattr(namespace, action.dest, action.const)
+            else:
+                if explicit_arg is None:
+                    if index >= num_args or args[index][:1] in prefix_chars:
+                        return None
+                    explicit_arg = args[index]
+                    index += 1
+                try:
+                    value = self._get_values(action, [explicit_arg])
+                except ArgumentError:
+                    return None
+                setattr(namespace, action.dest, value)
+            seen_actions.add(action)
+
+        for action in self._actions:
+            if action in seen_actions:
+                continue
+            if action.required:
+                return None
+            # Only the string defaults still in place are converted.
+            default = action.default
+            if isinstance(default, str) and getattr(
+                namespace, action.dest, None
+            ) is default:
+                try:
+                    setattr(
+                        namespace, action.dest,
+                        self._get_value(action, default)
+                    )
+                except ArgumentError:
+                    return None
+
+        return namespace
+
     def _check_value(self, action: Action, value: Any) -> None:
         if action.choices is not None and action.type is not None and callable(
             action.type
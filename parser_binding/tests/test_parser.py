@@ -1,7 +1,146 @@
 from ..parser import BindingParser
+from ..types import BindingField
 from .test_utils import TestClass
 
 
 def test_parser():
     parser = BindingParser(TestClass)
     parser.print_help()
+
+
+def test_add_dataclass():
+    from .test_training_args import DataArguments, TraningArguments
+
+    parser = BindingParser(DataArguments)
+    parser.add_datacalss(TraningArguments)
+    parser.add_datacalss(TraningArguments)
+
+    data_args, training_args = parser.parse_into_dataclasses(
+        (DataArguments, TraningArguments),
+        ['--train-file', 'a.txt', '--batch-size', '16'],
+        split_classes=True
+    )
+
+    assert data_args.train_file == ['a.txt']
+    assert training_args.batch_size == 16
+
+
+def test_fast_parse():
+    from .test_training_args import IOArguments, TraningArguments
+
+    parser = BindingParser(TraningArguments, IOArguments)
+    fast_parser = BindingParser(TraningArguments, IOArguments, fast_parse=True)
+
+    for arg_strs in (
+        [],
+        ['-o', 'checkpoints', '--batch-size', '16', '--with-dev'],
+        ['--optimizer=sgd', '--without_train', '--train-mode', '2'],
+        ['--learning-rate', '1e-4', '--epo', '8'],
+        ['--epoch', '-1'],
+    ):
+        assert fast_parser.parse_args(arg_strs) == parser.parse_args(arg_strs)
+
+    assert fast_parser._fast_parse_args(['--epo', '8']) is None
+    assert fast_parser._fast_parse_args(['--epoch', '-1']) is None
+    assert fast_parser._fast_parse_args(['--train-mode', '3']) is None
+    assert fast_parser._fast_parse_args(['--optimizer', 'sgd']) is not None
+
+    # The default of an option sharing the `dest` does not override the first.
+    from dataclasses import dataclass
+
+    @dataclass
+    class DebugArguments:
+        debug: bool = False
+
+    parser = BindingParser(DebugArguments)
+    fast_parser = BindingParser(DebugArguments, fast_parse=True)
+    for p in (parser, fast_parser):
+        p.add_argument('--no-debug', dest='debug', action='store_false')
+    for arg_strs in ([], ['--no-debug'], ['--with-debug']):
+        assert fast_parser._fast_parse_args(arg_strs) is not None
+        assert fast_parser.parse_args(arg_strs) == parser.parse_args(arg_strs)
+
+
+def test_gzip_file(tmp_path):
+    import gzip
+    from dataclasses import dataclass
+    from typing import IO
+
+    @dataclass
+    class FileArguments:
+        in_file: IO[str] = None
+        out_file: IO[bytes] = BindingField(default=None, file_mode='wb')
+
+    in_path, out_path = tmp_path / 'in.txt.gz', tmp_path / 'out.bin.gz'
+    with gzip.open(in_path, 'wt', encoding='utf-8') as f:
+        f.write('hello\n')
+
+    parser = BindingParser(FileArguments)
+    arg_strs = ['--in-file', str(in_path), '--out-file', str(out_path)]
+    args = parser.parse_into_dataclasses((FileArguments, ), arg_strs)
+    with args.in_file, args.out_file:
+        assert args.in_file.read() == 'hello\n'
+        args.out_file.write(b'world')
+
+    with gzip.open(out_path, 'rb') as f:
+        assert f.read() == b'world'
+
+
+def test_bytes_fields():
+    from dataclasses import dataclass
+    from typing import List
+
+    @dataclass
+    class BytesArguments:
+        token: bytes = 'secret'
+        keys: List[bytes] = BindingField(default=None, sep=',')
+
+    parser = BindingParser(BytesArguments)
+    args = parser.parse_into_dataclasses((BytesArguments, ), ['--keys', 'a,b'])
+    assert args.token == b'secret'
+    assert args.keys == [b'a', b'b']
+
+
+def test_shared_field_name():
+    from dataclasses import dataclass
+    from typing import List
+
+    @dataclass
+    class ListArguments:
+        x: List[int] = None
+
+    @dataclass
+    class IntArguments:
+        x: int = 0
+
+    parser = BindingParser(ListArguments, IntArguments)
+    args = parser.parse_into_dataclasses((ListArguments, ), ['-x', '3'])
+    assert args.x == 3
+
+    # The other parsers binding the same dataclass do not affect this one.
+    list_parser = BindingParser(ListArguments)
+    list_args, int_args = parser.parse_into_dataclasses(
+        (ListArguments, IntArguments), ['-x', '3'], split_classes=True
+    )
+    assert list_args.x == 3 and int_args.x == 0
+    args = list_parser.parse_into_dataclasses((ListArguments, ), ['-x', '3'])
+    assert args.x == [3]
+
+
+def test_default_factory():
+    import itertools
+    from dataclasses import dataclass, field
+
+    from ..parser import parse_args
+
+    counter = itertools.count()
+
+    @dataclass
+    class FactoryArguments:
+        mapping: dict = field(default_factory=dict)
+        index: int = field(default_factory=lambda: next(counter))
+
+    args1 = parse_args((FactoryArguments, ), [])
+    args1.mapping['x'] = 1
+    args2 = parse_args((FactoryArguments, ), [])
+    assert args2.mapping == {} and args2.index == 1
@@ -82,3 +82,10 @@ def test_bind_to_dataclasses():
     )
 
     assert type(args) is not type(args2)
+
+    args3 = parser.parse_into_dataclasses(
+        (DataArguments, TraningArguments, IOArguments, ModelArguments),
+        arg_strs
+    )
+
+    assert type(args) is type(args3)
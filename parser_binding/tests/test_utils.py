@@ -1,10 +1,19 @@
+import sys
 from argparse import ArgumentParser
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..types import BindingField
-from ..utils import analysis_dataclass
+import pytest
+
+from ..types import BindingField, DataWrapperType
+from ..utils import (
+    _analysis_type,
+    analysis_dataclass,
+    dict_type_fn,
+    enum_type_fn,
+    queue_wrapper,
+)
 
 
 class TestEnum(Enum):
@@ -65,3 +74,126 @@ def test_utils():
         parser.add_argument(*_type.options, **kwargs)
 
     parser.print_help()
+
+
+def test_options():
+    res = analysis_dataclass(TestClass)
+
+    assert res['complex_field'].options == [
+        '-f', '--complex-field', '--complex_field'
+    ]
+    assert res['a'].options == ['-a']
+    assert res['json'].options == ['--json']
+    assert res['success'].options == ['--without-success', '--without_success']
+    assert res['failed'].options == ['--with-failed', '--with_failed']
+
+
+def test_help_suffix():
+    res = analysis_dataclass(TestClass)
+
+    assert res['must'].help_suffix == 'REQUIRED.'
+    assert res['a'].help_suffix == 'Optional. Default `0`.'
+    assert res['kind'].help_suffix == 'Optional. Default `0`.'
+    assert res['json']._add_argument_spec['help'] == res['json'].help_suffix
+    assert res['complex_field'].help_suffix is res['complex_field'].help_suffix
+
+
+def test_dict_type_fn(tmp_path):
+    json_file = tmp_path / 'config.json'
+    json_file.write_text('{"1": "2"}', encoding='utf-8')
+
+    assert list(dict_type_fn(' {"1": "2"}', int, int).items()) == [(1, 2)]
+    assert list(dict_type_fn(str(json_file), int, str).items()) == [(1, '2')]
+    assert list(dict_type_fn(str(json_file), Any, Any).items()) == [('1', '2')]
+    assert list(dict_type_fn('{"1": 2}', None, str).items()) == [('1', '2')]
+    for val in ('[1, 2]', str(tmp_path / 'missing.json')):
+        with pytest.raises(TypeError):
+            dict_type_fn(val, str, str)
+
+
+def test_enum_type_fn():
+    assert enum_type_fn('1', TestEnum) is TestEnum.b
+    for val in ('2', 'b'):
+        with pytest.raises(ValueError):
+            enum_type_fn(val, TestEnum)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='requires PEP 604')
+def test_pep604_union():
+    assert _analysis_type(eval('int | None')) == _analysis_type(Optional[int])
+    dtype, wrapper_type = _analysis_type(eval('List[str] | None'))
+    assert dtype is str and wrapper_type is DataWrapperType.List
+
+
+@dataclass
+class StringAnnotatedClass:
+    count: 'int' = 0
+    names: 'Optional[List[str]]' = None
+    kind: 'TestEnum' = TestEnum.a
+
+
+def test_string_annotations():
+    res = analysis_dataclass(StringAnnotatedClass)
+    assert res['count'].type is int
+    assert res['names'].type is str
+    assert res['names'].wrapper_type is DataWrapperType.List
+    assert res['kind'].choices == ('0', '1')
+
+
+def test_analysis_warnings():
+    for _ in range(2):
+        with pytest.warns(UserWarning):
+            analysis_dataclass(TestClass)
+
+
+@pytest.mark.parametrize('backend', ['orjson', 'ujson'])
+def test_json_backend(backend, monkeypatch):
+    from .. import utils
+
+    monkeypatch.setattr(utils, '_json_backend', pytest.importorskip(backend))
+    # The values rejected by the fast backends are loaded by the standard json.
+    val = '{"big": 123456789012345678901234567890, "nan": NaN, "1": 2}'
+    res = dict_type_fn(val, None, None)
+    assert res['big'] == 123456789012345678901234567890
+    assert res['nan'] != res['nan']
+    assert list(dict_type_fn('{"1": 2}', int, str).items()) == [(1, '2')]
+    with pytest.raises(TypeError):
+        dict_type_fn('{"1": 2', None, None)
+
+
+@dataclass
+class PartlyAnnotatedClass:
+    count: 'int' = 0
+    custom: 'UndefinedType' = field(default=None, metadata={
+        'type': str
+    })
+    no_attr: 'sys.NoSuchThing' = field(default=None, metadata={
+        'type': str
+    })
+    bad_syntax: 'List[int' = field(default=None, metadata={
+        'type': str
+    })
+
+
+def test_unresolved_annotations():
+    with pytest.warns(UserWarning) as records:
+        res = analysis_dataclass(PartlyAnnotatedClass)
+    messages = ' '.join(str(record.message) for record in records)
+    for annotation in ('UndefinedType', 'sys.NoSuchThing', 'List[int'):
+        assert f'"{annotation}"' in messages
+    assert res['count'].type is int
+    assert res['custom'].type is str
+    assert res['no_attr'].type is str
+    assert res['bad_syntax'].type is str
+
+
+def test_queue_wrapper():
+    q = queue_wrapper(iter([1, 2, 3]))
+    assert q.qsize() == 3
+    assert [q.get_nowait() for _ in range(3)] == [1, 2, 3]
+    assert q.empty()
+    for _ in range(3):
+        q.task_done()
+    # `join` returns at once as all the tasks are done.
+    assert q.unfinished_tasks == 0
+    q.join()
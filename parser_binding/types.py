@@ -1,16 +1,31 @@
 '''
 defined the data classes to bind the argument parser.
 '''
-import gzip
 import sys
 from argparse import ArgumentTypeError, FileType
 from dataclasses import MISSING, dataclass, field
 from enum import Enum
-from typing import IO, Any, Callable, List, Optional, Set, TypeVar, Union
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 DataclassType = TypeVar('DataclassType')
 _ActualDType = TypeVar('_ActualDType')
 
+# `slots` is only accepted by `dataclass` since Python 3.10.
+_DATACLASS_SLOTS = {}
+if sys.version_info >= (3, 10):
+    _DATACLASS_SLOTS['slots'] = True
+
 
 def is_shortcut(name: str) -> bool:
     '''
@@ -22,10 +37,7 @@ def is_shortcut(name: str) -> bool:
         Returns:
             True if the name is a shortcut option, otherwise False.
     '''
-    if '_' in name or len(name) > 1:
-        return False
-
-    return True
+    return len(name) == 1 and name != '_'
 
 
 class DataWrapperType(Enum):
@@ -68,13 +80,15 @@ class DataWrapperType(Enum):
 
     @staticmethod
     def is_basic_collection(type: 'DataWrapperType') -> bool:
-        if type is DataWrapperType.List or \
-            type is DataWrapperType.Tuple or \
-            type is DataWrapperType.Set or \
-            type is DataWrapperType.Queue or \
-            type is DataWrapperType.Dequeue:
-            return True
-        return False
+        return type in _BASIC_COLLECTION_TYPES
+
+
+_BASIC_COLLECTION_TYPES = frozenset(
+    {
+        DataWrapperType.List, DataWrapperType.Tuple, DataWrapperType.Set,
+        DataWrapperType.Queue, DataWrapperType.Dequeue
+    }
+)
 
 
 class FileTypeWithGzip(FileType):
@@ -89,21 +103,25 @@ class FileTypeWithGzip(FileType):
     ) -> None:
         super(FileTypeWithGzip, self).__init__(mode, bufsize, encoding, errors)
         self.content_type = content_type
+        self._gzip_mode = 'rt' if mode == 'r' and content_type is str else mode
+        # `gzip.open` only accepts the encoding in text mode.
+        self._gzip_encoding = encoding if 't' in self._gzip_mode else None
 
     def __call__(self, string: str) -> IO[Any]:
         if not string.endswith('.gz'):
             return super(FileTypeWithGzip, self).__call__(string)
         else:
+            import gzip
+
             try:
-                mode = self._mode
-                if self.content_type is str:
-                    mode = 'rt' if mode == 'r' else self._mode
-                return gzip.open(string, mode, self._encoding)
+                return gzip.open(
+                    string, self._gzip_mode, encoding=self._gzip_encoding
+                )
             except OSError as e:
                 raise ArgumentTypeError("can't open '%s': %s" % (string, e))
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BindingType:
     '''
         The binding type used to store the value from dataclass fields and bind to the argument parser.
@@ -137,7 +155,8 @@ class BindingType:
             File encoding for file fields.
 
         The BindingType class is used to define metadata for storing values from dataclass fields
-        and facilitating binding to the argument parser.
+        and facilitating binding to the argument parser. The instances are immutable, and the
+        `options`, `help_suffix`, `action` and `is_switch` are computed once on construction.
     '''
     name: str
     type: Optional[Callable] = None
@@ -153,6 +172,32 @@ class BindingType:
     file: bool = False
     file_mode: str = 'r'
     file_encoding: str = 'utf-8'
+    _options: List[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _help_suffix: str = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _action: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _is_switch: bool = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _add_argument_spec: Mapping = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # The instance is frozen, the derived attributes are set with the
+        # `object.__setattr__` as what `dataclasses` does for frozen instances.
+        object.__setattr__(self, '_options', self._build_options())
+        object.__setattr__(self, '_help_suffix', self._build_help_suffix())
+        object.__setattr__(self, '_action', self._build_action())
+        object.__setattr__(self, '_is_switch', self._build_is_switch())
+        object.__setattr__(
+            self, '_add_argument_spec', self._build_add_argument_spec()
+        )
 
     @property
     def default_file(self):
@@ -169,6 +214,52 @@ class BindingType:
 
     @property
     def help_suffix(self) -> str:
+        return self._help_suffix
+
+    @property
+    def action(self) -> Optional[str]:
+        return self._action
+
+    @property
+    def is_switch(self) -> bool:
+        return self._is_switch
+
+    @property
+    def options(self) -> List[str]:
+        return self._options
+
+    def _build_add_argument_spec(self) -> Mapping[str, Any]:
+        '''
+            Build the keyword arguments passed to `ArgumentParser.add_argument`,
+            the options and the `dest` are excluded.
+        '''
+        kwargs = {
+            'action': self._action,
+            'nargs': '*' if self.multiple and self.seperator is None else None,
+            'default': self.default,
+            'type': self.type,
+            'choices': self.choices,
+            'help': ' '.join(filter(None, (self.help, self._help_suffix))),
+            'required': self.required
+        }
+        if self._is_switch:
+            for k in ('nargs', 'type', 'choices'):
+                kwargs.pop(k)
+        if self.wrapper_type is DataWrapperType.File or self.file:
+            kwargs['type'] = FileTypeWithGzip(
+                mode=self.file_mode,
+                encoding=self.file_encoding,
+                content_type=self.type
+            )
+            kwargs['default'] = self.default_file
+            for k in ('nargs', 'choices', 'action'):
+                kwargs.pop(k)
+        if self.required:
+            kwargs.pop('default')
+
+        return MappingProxyType(kwargs)
+
+    def _build_help_suffix(self) -> str:
         doc_suffix = []
         if self.multiple and self.seperator is not None:
             doc_suffix.append(
@@ -198,8 +289,7 @@ class BindingType:
 
         return ' '.join(doc_suffix)
 
-    @property
-    def action(self) -> Optional[bool]:
+    def _build_action(self) -> Optional[str]:
         if self.wrapper_type is not DataWrapperType.Bool:
             return None
         if self.default is True:
@@ -207,52 +297,54 @@ class BindingType:
         else:
             return 'store_true'
 
-    @property
-    def is_switch(self) -> bool:
+    def _build_is_switch(self) -> bool:
         if self.wrapper_type is not DataWrapperType.Bool:
             return False
         else:
             return True
 
-    @property
-    def options(self) -> List[str]:
-        names = set([self.name])
-        if self.aliases is not None:
-            names.update(self.aliases)
-
-        final_options: Set[str] = set()
-        for name in names:
-            if self.wrapper_type is DataWrapperType.Bool:
-                if self.default is True:
-                    final_options.add('--without-' + name.replace('_', '-'))
-                    final_options.add('--without_' + name.replace('-', '_'))
-                else:
-                    final_options.add('--with-' + name.replace('_', '-'))
-                    final_options.add('--with_' + name.replace('-', '_'))
+    def _build_options(self) -> List[str]:
+        names = (self.name, *(self.aliases or ()))
+
+        # Options are collected in the order shown in the help message:
+        # shortcuts first, then the `-` separated ones and the `_` separated
+        # ones at last.
+        shortcut_options: List[str] = []
+        dash_options: List[str] = []
+        underscore_options: List[str] = []
+        seen: Set[str] = set()
+
+        def add_option(options: List[str], option: str):
+            if option not in seen:
+                seen.add(option)
+                options.append(option)
+
+        if self.wrapper_type is DataWrapperType.Bool:
+            if self.default is True:
+                dash_prefix, underscore_prefix = '--without-', '--without_'
             else:
-                if is_shortcut(name):
-                    final_options.add('-' + name)
-                else:
-                    final_options.add('--' + name.replace('-', '_'))
-                    final_options.add('--' + name.replace('_', '-'))
-
-        def compare_option(option: str):
-            if len(option[1:]) <= 1:
-                return -1
-            if option.startswith('--'):
-                if '_' not in option:
-                    return 0
-                elif '-' in option:
-                    return 1
+                dash_prefix, underscore_prefix = '--with-', '--with_'
+        else:
+            dash_prefix, underscore_prefix = '--', '--'
+        for name in names:
+            if self.wrapper_type is not DataWrapperType.Bool and is_shortcut(
+                name
+            ):
+                add_option(shortcut_options, '-' + name)
+            elif '_' not in name and '-' not in name:
+                # Both forms are the same name, only the switches still have
+                # two options due to their different prefixes.
+                add_option(dash_options, dash_prefix + name)
+                if underscore_prefix != dash_prefix:
+                    add_option(underscore_options, underscore_prefix + name)
             else:
-                return 2
-
-        final_options = sorted(
-            sorted(list(final_options), key=lambda x: len(x)),
-            key=compare_option
-        )
+                add_option(dash_options, dash_prefix + name.replace('_', '-'))
+                add_option(
+                    underscore_options,
+                    underscore_prefix + name.replace('-', '_')
+                )
 
-        return final_options
+        return shortcut_options + dash_options + underscore_options
 
 
 def BindingField(
@@ -3,12 +3,13 @@ methods to bind the parser to the dataclass.
 '''
 import json
 import os
+import sys
 import types
 import warnings
 from collections import deque
 from dataclasses import MISSING, Field, fields, is_dataclass
 from enum import Enum
-from functools import partial
+from functools import lru_cache
 from inspect import isclass
 from queue import Queue
 from typing import (
@@ -16,23 +17,57 @@ from typing import (
     Any,
     BinaryIO,
     Callable,
-    Deque,
     Dict,
-    List,
+    Literal,
+    Mapping,
     Optional,
-    Set,
     TextIO,
     Tuple,
     Type,
     Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 
-from .types import BindingType, DataclassType, DataWrapperType
+from .types import (
+    BindingType,
+    DataclassType,
+    DataWrapperType,
+)
+
+# `X | Y` is typed as `types.UnionType` since Python 3.10.
+_UNION_TYPES = (Union, )
+if hasattr(types, 'UnionType'):
+    _UNION_TYPES = (Union, types.UnionType)
 
+# Prefer the faster JSON libraries to load the dictionary values if installed.
 try:
-    from typing import Literal
-except:
-    Literal = None
+    import orjson as _json_backend
+except ImportError:
+    try:
+        import ujson as _json_backend
+    except ImportError:
+        _json_backend = json
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    '''
+        Load the JSON with the preferred backend, the standard `json` is used instead
+        if the backend rejects the data, e.g. the integers over 64 bits or `NaN` for
+        orjson, so that the result does not depend on the installed backend.
+    '''
+    try:
+        return _json_backend.loads(data)
+    except (ValueError, OverflowError):
+        if _json_backend is json:
+            raise
+        return json.loads(data)
+
+
+# The caches keyed on the types are bounded, so that the types created at
+# runtime are not kept alive forever.
+_TYPE_CACHE_SIZE = 256
 
 
 def identity_type(x):
@@ -53,13 +88,24 @@ def identity_type(x):
     return x
 
 
+def _bytes_utf8(val: Union[str, bytes]) -> bytes:
+    '''
+        Convert the command-line string to bytes with UTF-8, used as the type of
+        the `bytes` fields.
+    '''
+    if isinstance(val, str):
+        return val.encode('utf-8')
+
+    return bytes(val)
+
+
 def queue_wrapper(collection):
     '''
         Convert a collection to a queue.
 
         This function takes a collection and converts it into a queue using the 
-        `Queue` class. Each item in the collection is added to the queue using 
-        the `put_nowait` method.
+        `Queue` class. The items are added to the underlying deque directly,
+        as the new queue is not shared yet there is no need to lock each put.
 
         Parameters:
         - collection: `Iterable`
@@ -70,34 +116,15 @@ def queue_wrapper(collection):
             A queue containing the elements from the input collection.
     '''
     q = Queue()
-    for item in collection:
-        q.put_nowait(item)
-
-    return q
-
-
-def dequeue_wrapper(collection):
-    '''
-        Convert a collection to a deque.
-
-        This function takes a collection and converts it into a deque using the 
-        `deque` class. Each item in the collection is appended to the deque.
-
-        Parameters:
-        - collection: `Iterable`
-            The collection to be converted to a deque.
-
-        Returns:
-        - `collections.deque`
-            A deque containing the elements from the input collection.
-    '''
-    q = deque(collection)
+    items = list(collection)
+    q.queue.extend(items)
+    q.unfinished_tasks += len(items)
 
     return q
 
 
 def collection_type_with_sep_fn(
-    val: str, sep: str, dtype: Callable, wrapper_type: Callable
+    val: str, sep: str, dtype: Optional[Callable], wrapper_type: Callable
 ):
     '''
         Convert a string joined by a separator to another collection type.
@@ -112,8 +139,9 @@ def collection_type_with_sep_fn(
             The input string joined by the separator.
         - sep (`str`): 
             The separator used to split the input string.
-        - dtype (`Callable`): 
-            A callable representing the data type conversion function for each item.
+        - dtype (`Optional[Callable]`): 
+            A callable representing the data type conversion function for each item,
+            the items are kept as strings if it is `None`.
         - wrapper_type (`Callable`): 
             A callable representing the type of collection to be constructed.
 
@@ -132,13 +160,15 @@ def collection_type_with_sep_fn(
         ```
     '''
     items = val.split(sep)
-    items = wrapper_type(list(map(dtype, items)))
+    if dtype is None or dtype is identity_type:
+        return wrapper_type(items)
 
-    return items
+    return wrapper_type(map(dtype, items))
 
 
 def dict_type_fn(
-    val: Union[str, os.PathLike], k_type: Callable, v_type: Callable
+    val: Union[str, os.PathLike], k_type: Optional[Callable],
+    v_type: Optional[Callable]
 ):
     '''
         Convert a JSON string or a JSON file to a dictionary object.
@@ -150,10 +180,12 @@ def dict_type_fn(
         Parameters:
         - val (`Union[str, os.PathLike]`): 
             Either a JSON string or the path to a JSON file.
-        - k_type (`Callable`): 
-            A callable representing the key type conversion function.
-        - v_type (`Callable`): 
-            A callable representing the value type conversion function.
+        - k_type (`Optional[Callable]`): 
+            A callable representing the key type conversion function, the keys
+            are kept as is if it is `None`.
+        - v_type (`Optional[Callable]`): 
+            A callable representing the value type conversion function, the values
+            are kept as is if it is `None`.
 
         Returns:
         - dict
@@ -163,29 +195,82 @@ def dict_type_fn(
         - Exception: 
             If the input `val` is neither a valid JSON string nor a valid JSON file.
     '''
-    if v_type is Any:
-        v_type = identity_type
-    if k_type is Any:
-        k_type = identity_type
-    try:
-        dict_data = json.loads(val)
-        dict_data = {
-            k_type(k): v_type(v)
+    if v_type is Any or v_type is identity_type:
+        v_type = None
+    if k_type is Any or k_type is identity_type:
+        k_type = None
+    # Only a JSON object can be converted to a dictionary, skip parsing the
+    # value as JSON if it is apparently a path.
+    first_char = val.lstrip()[:1] if isinstance(val, str) else ''
+    if first_char in ('{', '['):
+        try:
+            return _apply_types(_json_loads(val), k_type, v_type)
+        except Exception:
+            pass
+    if os.path.isfile(val):
+        with open(val, 'rb') as f:
+            dict_data = _json_loads(f.read())
+        return _apply_types(dict_data, k_type, v_type)
+    raise TypeError(
+        'The input value is neither a valid JSON string nor a valid JSON file'
+    )
+
+
+def _apply_types(
+    dict_data: Any, k_type: Optional[Callable], v_type: Optional[Callable]
+) -> Dict:
+    if not isinstance(dict_data, dict):
+        raise TypeError('The JSON value is not an object')
+    if k_type is None:
+        if v_type is None:
+            return dict_data
+        return {
+            k: v_type(v)
             for k, v in dict_data.items()
         }
-        return dict_data
-    except:
-        if os.path.isfile(val) and os.path.exists(val):
-            with open(val, 'r', encoding='utf-8') as f:
-                dict_data = json.load(f)
-            dict_data = {
-                k_type(k): v_type(v)
-                for k, v in dict_data.items()
-            }
-            return dict_data
-        raise TypeError(
-            'The input value is neither a valid JSON string nor a valid JSON file'
-        )
+    if v_type is None:
+        return {
+            k_type(k): v
+            for k, v in dict_data.items()
+        }
+
+    return {
+        k_type(k): v_type(v)
+        for k, v in dict_data.items()
+    }
+
+
+def _make_sep_conv(sep: str, dtype: Callable,
+                   wrapper_type: Callable) -> Callable[[str], Any]:
+    '''
+        Make the type function splitting the value with `sep` into a collection,
+        see `collection_type_with_sep_fn`.
+    '''
+
+    def collection_type(val: str):
+        return collection_type_with_sep_fn(val, sep, dtype, wrapper_type)
+
+    return collection_type
+
+
+def _make_dict_conv(k_type: Optional[Callable],
+                    v_type: Optional[Callable]) -> Callable[[str], Dict]:
+    '''
+        Make the type function converting the value to a dictionary, see `dict_type_fn`.
+    '''
+
+    def dict_type(val: Union[str, os.PathLike]):
+        return dict_type_fn(val, k_type, v_type)
+
+    return dict_type
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _enum_str_map(enum_type: Type[Enum]) -> Dict[str, Enum]:
+    return {
+        str(item.value): item
+        for item in enum_type
+    }
 
 
 def enum_type_fn(val: str, enum_type: Type[Enum]) -> Enum:
@@ -193,8 +278,8 @@ def enum_type_fn(val: str, enum_type: Type[Enum]) -> Enum:
         Convert a string to an enum value.
 
         This function takes a string `val` and an Enum type `enum_type`,
-        iterates through the enum values, and returns the first enum value
-        whose value matches the provided string after conversion.
+        and returns the enum value whose value matches the provided string
+        when converted to a string.
 
         Parameters:
         - val (`str`): 
@@ -210,245 +295,272 @@ def enum_type_fn(val: str, enum_type: Type[Enum]) -> Enum:
         - `ValueError`: 
             If no matching enum value is found for the provided string.
     '''
-    for item in enum_type:
-        if type(item.value)(val) == item.value:
-            return item
+    hit = _enum_str_map(enum_type).get(val)
+    if hit is not None:
+        return hit
 
     raise ValueError(f'No matching enum value found for the string: {val}')
 
 
-def _get_choices(dtype) -> List:
-    origin_type = getattr(dtype, '__origin__', dtype)
-    if origin_type is Union or (
-        hasattr(dtype, 'UnionType')
-        and isinstance(origin_type, types.UnionType)
-    ):
-        dtype_generics = dtype.__args__
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _enum_choice_info(dtype) -> Tuple[Tuple[str, ...], Dict[Any, Any]]:
+    '''
+        Get the string choices of a Literal or Enum type (`Optional` allowed) for
+        the command-line, and the mapping from the choices to the values.
+    '''
+    origin_type = get_origin(dtype) or dtype
+    if origin_type in _UNION_TYPES:
+        dtype_generics = get_args(dtype)
         dtype_generics = list(
             filter(lambda x: x is not type(None), dtype_generics)
         )
-        return _get_choices(dtype_generics[0])
+        return _enum_choice_info(dtype_generics[0])
+
+    if origin_type is Literal:
+        choice_values = get_args(dtype)
+        choices = tuple(map(str, choice_values))
     else:
-        if (
-            Literal is not None
-            and getattr(dtype, '__origin__', None) is Literal
-        ):
-            choices = dtype.__args__
-        else:
-            choices = [item.value for item in dtype]
-        return tuple(map(str, choices))
+        choice_values = tuple(dtype)
+        choices = tuple(str(item.value) for item in choice_values)
+
+    # The string forms take precedence over the values themselves.
+    str2choice = {}
+    for choice, val in zip(choices, choice_values):
+        str2choice[choice] = val
+        str2choice.setdefault(val, val)
+
+    return choices, str2choice
+
+
+def _make_literal_mapper(str2choice: Dict[Any, Any]) -> Callable[[Any], Any]:
+    '''
+        Make the type function converting the command-line value to the choice,
+        `None` is returned if the value is not one of the choices.
+    '''
+
+    def literal_type(x):
+        return str2choice.get(x)
+
+    return literal_type
+
+
+# The element types can be converted from the command-line values directly.
+_SCALAR_OK = frozenset({int, str, float, bytes, identity_type, None})
 
+# The generics assumed for the containers annotated without element types,
+# `None` keeps the values unconverted.
+_CONTAINER_GENERICS_DEFAULT = (None, )
+_DICT_GENERICS_DEFAULT = (None, None)
 
+# The single-element generic containers, checked in order by `_analysis_type`,
+# the `typing` aliases (e.g. `List`, `Deque`) have these as their origins.
+_CONTAINERS = (
+    (list, DataWrapperType.List),
+    (tuple, DataWrapperType.Tuple),
+    (set, DataWrapperType.Set),
+    (deque, DataWrapperType.Dequeue),
+    (Queue, DataWrapperType.Queue),
+)
+
+
+def _analysis_container_type(
+    dtype, wrapper_type: DataWrapperType
+) -> Tuple[Optional[Callable], DataWrapperType]:
+    '''
+        Analysis the element type of a single-element generic container, the container is
+        complex if the element type is not a basic type.
+    '''
+    dtype_generics = get_args(dtype)
+    if dtype_generics:
+        dtype_generics = [
+            x for x in dtype_generics
+            if x is not type(None) and x is not ... and x is not type(...)
+        ]
+    else:
+        dtype_generics = _CONTAINER_GENERICS_DEFAULT
+    if len(dtype_generics) != 1 or dtype_generics[0] not in _SCALAR_OK:
+        return None, DataWrapperType.Complex
+
+    return dtype_generics[0], wrapper_type
+
+
+# The types can be converted from the command-line values directly.
+_BASIC_TYPES = {
+    str: (str, DataWrapperType.Basic),
+    int: (int, DataWrapperType.Basic),
+    bytes: (bytes, DataWrapperType.Basic),
+    float: (float, DataWrapperType.Basic),
+    bool: (bool, DataWrapperType.Bool),
+}
+
+
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
 def _analysis_type(dtype) -> Optional[Tuple[Callable, DataWrapperType]]:
-    if dtype == MISSING:
+    if dtype is MISSING:
         return None, DataWrapperType.Unknown
-    if dtype is str or dtype is int or dtype is bytes or dtype is float:
-        return dtype, DataWrapperType.Basic
-    elif dtype is bool:
-        return dtype, DataWrapperType.Bool
-    else:
-        origin_type = getattr(dtype, '__origin__', dtype)
-        if origin_type is Union or (
-            hasattr(dtype, 'UnionType')
-            and isinstance(origin_type, types.UnionType)
-        ):
-            dtype_generics = dtype.__args__
+    basic = _BASIC_TYPES.get(dtype)
+    if basic is not None:
+        return basic
+
+    origin_type = get_origin(dtype) or dtype
+    if origin_type in _UNION_TYPES:
+        dtype_generics = get_args(dtype)
+        dtype_generics = list(
+            filter(lambda x: x is not type(None), dtype_generics)
+        )
+
+        if len(dtype_generics) > 1:
+            raise ValueError(
+                "Only `Union[X, NoneType]` (i.e., `Optional[X]`) is allowed for `Union` because"
+                " the argument parser only supports one type per argument."
+                f" Problem encountered in field."
+            )
+        return _analysis_type(dtype_generics[0])
+    if origin_type is Literal or (
+        isinstance(dtype, type) and issubclass(dtype, Enum)
+    ):
+        _, str2choice = _enum_choice_info(dtype)
+        return _make_literal_mapper(str2choice), (
+            DataWrapperType.Literal
+            if origin_type is Literal else DataWrapperType.Enum
+        )
+    if dtype is Dict or (
+        isclass(origin_type) and issubclass(origin_type, dict)
+    ):
+        dtype_generics = get_args(dtype)
+        if dtype_generics:
             dtype_generics = list(
                 filter(lambda x: x is not type(None), dtype_generics)
             )
+        else:
+            dtype_generics = _DICT_GENERICS_DEFAULT
+        assert len(
+            dtype_generics
+        ) == 2, 'The dict dtype must has key type and value type.'
+
+        if not all(t in _SCALAR_OK for t in dtype_generics):
+            return None, DataWrapperType.Complex
+
+        dicttype = _make_dict_conv(dtype_generics[0], dtype_generics[1])
+
+        return dicttype, DataWrapperType.Dict
 
-            if len(dtype_generics) > 1:
-                raise ValueError(
-                    "Only `Union[X, NoneType]` (i.e., `Optional[X]`) is allowed for `Union` because"
-                    " the argument parser only supports one type per argument."
-                    f" Problem encountered in field."
+    if isclass(origin_type):
+        for base_type, base_wrapper_type in _CONTAINERS:
+            if issubclass(origin_type, base_type):
+                return _analysis_container_type(dtype, base_wrapper_type)
+
+    if (dtype is TextIO or (isclass(origin_type) and issubclass(origin_type, TextIO))) or \
+        ((dtype is BinaryIO) or (isclass(origin_type) and issubclass(origin_type, BinaryIO))) or \
+        (dtype is IO or (isclass(origin_type) and issubclass(origin_type, IO))):
+
+        dtype_generics = get_args(dtype)
+        if dtype_generics:
+            dtype_generics = list(
+                filter(
+                    lambda x: x is not type(None) and x is not type(...),
+                    dtype_generics
                 )
-            return _analysis_type(dtype_generics[0])
-        if (Literal is not None and origin_type is Literal
-            ) or (isinstance(dtype, type) and issubclass(dtype, Enum)):
-            if (Literal is not None and origin_type is Literal):
-                choice_values = dtype.__args__
-            else:
-                choice_values = [item for item in dtype]
-            choices = _get_choices(dtype)
-
-            str2choice = {
-                str(choice): val
-                for choice, val in zip(choices, choice_values)
-            }
-            identity_map = {
-                val: val
-                for val in choice_values
-                if val not in str2choice
-            }
-            str2choice.update(identity_map)
-            return lambda x: str2choice.get(x), (
-                DataWrapperType.Literal if Literal is not None
-                and dtype is Literal else DataWrapperType.Enum
             )
-        if dtype is Dict or (
-            isclass(origin_type) and issubclass(origin_type, dict)
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(lambda x: x is not type(None), dtype_generics)
-                )
-            else:
-                dtype_generics = [identity_type, identity_type]
-            assert len(
-                dtype_generics
-            ) == 2, 'The dict dtype must has key type and value type.'
-
-            if not all(
-                [
-                    t in (int, str, float, bytes, identity_type)
-                    for t in dtype_generics
-                ]
+        else:
+            dtype_generics = _CONTAINER_GENERICS_DEFAULT
+            if (
+                dtype is TextIO
+                or (isclass(origin_type) and issubclass(origin_type, TextIO))
             ):
-                return None, DataWrapperType.Complex
+                dtype_generics = [str]
 
-            dicttype = partial(
-                dict_type_fn,
-                k_type=dtype_generics[0],
-                v_type=dtype_generics[1]
-            )
+        return dtype_generics[0], DataWrapperType.File
 
-            return dicttype, DataWrapperType.Dict
-
-        if (
-            dtype is List
-            or (isclass(origin_type) and issubclass(origin_type, list))
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-            if len(dtype_generics) > 1 or dtype_generics[0] not in (
-                int, str, float, bytes, identity_type
-            ):
-                return None, DataWrapperType.Complex
-
-            return dtype_generics[0], DataWrapperType.List
-        if (
-            dtype is Tuple
-            or (isclass(origin_type) and issubclass(origin_type, tuple))
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-            if len(dtype_generics) > 1 or dtype_generics[0] not in (
-                int, str, float, bytes, identity_type
-            ):
-                return None, DataWrapperType.Complex
-            return dtype_generics[0], DataWrapperType.Tuple
-        if (
-            dtype is Set
-            or (isclass(origin_type) and issubclass(origin_type, set))
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-            if len(dtype_generics) > 1 or dtype_generics[0] not in (
-                int, str, float, bytes, identity_type
-            ):
-                return None, DataWrapperType.Complex
-            return dtype_generics[0], DataWrapperType.Set
-        if dtype is Deque or (
-            isclass(origin_type) and issubclass(origin_type, deque)
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-            if len(dtype_generics) > 1 or dtype_generics[0] not in (
-                int, str, float, bytes, identity_type
-            ):
-                return None, DataWrapperType.Complex
-            return dtype_generics[0], DataWrapperType.Dequeue
-        if dtype is Queue or (
-            isclass(origin_type) and issubclass(origin_type, Queue)
-        ):
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-            if len(dtype_generics) > 1 or dtype_generics[0] not in (
-                int, str, float, bytes, identity_type
-            ):
-                return None, DataWrapperType.Complex
-            return dtype_generics[0], DataWrapperType.Queue
-
-        if (dtype is TextIO or (isclass(origin_type) and issubclass(origin_type, TextIO))) or \
-            ((dtype is BinaryIO) or (isclass(origin_type) and issubclass(origin_type, BinaryIO))) or \
-            (dtype is IO or (isclass(origin_type) and issubclass(origin_type, IO))):
-
-            if hasattr(dtype, '__args__'):
-                dtype_generics = dtype.__args__
-                dtype_generics = list(
-                    filter(
-                        lambda x: x is not type(None) and x is not type(...),
-                        dtype_generics
-                    )
-                )
-            else:
-                dtype_generics = [identity_type]
-                if (
-                    dtype is TextIO or
-                    (isclass(origin_type) and issubclass(origin_type, TextIO))
-                ):
-                    dtype_generics = [str]
+    return None, DataWrapperType.Unknown
 
-            return dtype_generics[0], DataWrapperType.File
 
-        return None, DataWrapperType.Unknown
+def dataclass_fields(cls: Type[DataclassType]) -> Tuple[Field, ...]:
+    '''
+        Get the fields of a dataclass, the result of `dataclasses.fields` is cached
+        on the class as `__binding_fields_tuple__` at the first call.
+
+        Parameters:
+        - cls (`Type[DataclassType]`):
+            The dataclass to get the fields from.
+
+        Returns:
+        - `Tuple[dataclasses.Field, ...]`
+            The fields of the dataclass, without the `ClassVar` and `InitVar` pseudo-fields.
+    '''
+    cls_fields = cls.__dict__.get('__binding_fields_tuple__')
+    if cls_fields is None:
+        cls_fields = fields(cls)
+        cls.__binding_fields_tuple__ = cls_fields
+
+    return cls_fields
 
 
-def analysis_filed(field: Field) -> Optional[BindingType]:
+@lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _type_hints(cls: Type[DataclassType]) -> Mapping[str, Any]:
+    '''
+        Resolve the annotations of a dataclass, e.g. the string annotations with
+        `from __future__ import annotations`. If any of them can not be resolved,
+        the annotations are resolved one by one and the failed ones are left out.
+    '''
+    try:
+        return types.MappingProxyType(get_type_hints(cls))
+    except Exception:
+        pass
+
+    hints = {}
+    for base in reversed(cls.__mro__):
+        base_annotations = base.__dict__.get('__annotations__', {})
+        module = sys.modules.get(base.__module__)
+        base_globals = getattr(module, '__dict__', {})
+        base_locals = dict(vars(base))
+        for name, annotation in base_annotations.items():
+            if isinstance(annotation, str):
+                try:
+                    annotation = eval(annotation, base_globals, base_locals)
+                except Exception:
+                    hints.pop(name, None)
+                    continue
+            hints[name] = annotation
+
+    return types.MappingProxyType(hints)
+
+
+# The constructors of the collection types, for both the values splitted with
+# the seperator and the values parsed into the dataclasses.
+_WRAPPER_CLS = {
+    DataWrapperType.List: list,
+    DataWrapperType.Tuple: tuple,
+    DataWrapperType.Set: set,
+    DataWrapperType.Queue: queue_wrapper,
+    DataWrapperType.Dequeue: deque,
+}
+
+
+def analysis_filed(field: Field,
+                   field_type: Optional[Any] = None) -> Optional[BindingType]:
     if not field.init:
         return None
 
-    dtype, wrapper_type = _analysis_type(field.type)
-
-    if field.metadata.get('type', None):
+    if field_type is None:
+        field_type = field.type
+    dtype, wrapper_type = _analysis_type(field_type)
+
+    md_get = field.metadata.get
+    meta_type = md_get('type')
+    meta_help = md_get('help')
+    meta_required = md_get('required')
+    meta_choices = md_get('choices')
+    meta_multiple = md_get('multiple')
+    if meta_type:
         if dtype is not None:
             warnings.warn(
                 f'The type for "{field.name}" will be occupied with meta.',
                 UserWarning
             )
-        dtype = field.metadata.get('type')
+        dtype = meta_type
+    if dtype is bytes:
+        dtype = _bytes_utf8
 
     default = None
     required = False
@@ -464,30 +576,12 @@ def analysis_filed(field: Field) -> Optional[BindingType]:
 
     choices = None
     if wrapper_type is DataWrapperType.Literal or wrapper_type is DataWrapperType.Enum:
-        choices = _get_choices(field.type)
+        choices, _ = _enum_choice_info(field_type)
 
-    multiple = False
-    if wrapper_type is DataWrapperType.List or wrapper_type is DataWrapperType.Tuple or wrapper_type is DataWrapperType.Set or wrapper_type is DataWrapperType.Queue or wrapper_type is DataWrapperType.Dequeue:
-        multiple = True
-    sep = field.metadata.get('sep', None) if multiple else None
+    multiple = DataWrapperType.is_basic_collection(wrapper_type)
+    sep = md_get('sep') if multiple else None
     if sep:
-        wrapper_cls = lambda x: x
-        if wrapper_type is DataWrapperType.List:
-            wrapper_cls = list
-        elif wrapper_type is DataWrapperType.Tuple:
-            wrapper_cls = tuple
-        elif wrapper_type is DataWrapperType.Set:
-            wrapper_cls = set
-        elif wrapper_type is DataWrapperType.Queue:
-            wrapper_cls = queue_wrapper
-        elif wrapper_type is DataWrapperType.Dequeue:
-            wrapper_cls = dequeue_wrapper
-        dtype = partial(
-            collection_type_with_sep_fn,
-            sep=sep,
-            dtype=dtype,
-            wrapper_type=wrapper_cls
-        )
+        dtype = _make_sep_conv(sep, dtype, _WRAPPER_CLS[wrapper_type])
 
     if wrapper_type is DataWrapperType.Bool:
         dtype = None
@@ -497,30 +591,28 @@ def analysis_filed(field: Field) -> Optional[BindingType]:
             UserWarning
         )
 
-    if wrapper_type is DataWrapperType.Complex and field.metadata.get(
-        'help', None
-    ) is None:
+    if wrapper_type is DataWrapperType.Complex and meta_help is None:
         warnings.warn(
             f'The filed "{field.name}" is complex but there is no help doc provided, this could make the option confused.'
         )
-    if wrapper_type is DataWrapperType.Unknown and field.metadata.get(
-        'type', None
-    ) is None:
+    if wrapper_type is DataWrapperType.Unknown and meta_type is None:
         raise Exception(
             f'The filed "{field.name}" is unkown type, you have to specify the type convert function in the meta.'
         )
 
-    if field.metadata.get('required', None) is not None:
-        required = field.metadata.get('required')
-    if field.metadata.get('choices', None) is not None:
-        choices = field.metadata.get('choices')
-    if field.metadata.get('multiple', None) is not None:
-        multiple = field.metadata.get('multiple')
-    if dtype is bytes:
-        dtype = partial(bytes, encoding='utf-8')
+    if meta_required is not None:
+        required = meta_required
+    if meta_choices is not None:
+        choices = meta_choices
+    if meta_multiple is not None:
+        multiple = meta_multiple
+
+    aliases = md_get('aliases')
+    if aliases is not None:
+        aliases = [sys.intern(alias) for alias in aliases]
 
     return BindingType(
-        name=field.name,
+        name=sys.intern(field.name),
         type=dtype,
         default=default,
         choices=choices,
@@ -528,22 +620,44 @@ def analysis_filed(field: Field) -> Optional[BindingType]:
         seperator=sep,
         wrapper_type=wrapper_type,
         required=required,
-        aliases=field.metadata.get('aliases', None),
-        help=field.metadata.get('help', ''),
-        file=field.metadata.get('file', False),
-        file_mode=field.metadata.get('file_mode', 'r'),
-        file_encoding=field.metadata.get('file_encoding', 'utf-8')
+        aliases=aliases,
+        help='' if meta_help is None else meta_help,
+        file=md_get('file', False),
+        file_mode=md_get('file_mode', 'r'),
+        file_encoding=md_get('file_encoding', 'utf-8')
     )
 
 
 def analysis_dataclass(*clz: Type[DataclassType]) -> Dict[str, BindingType]:
-    types: Dict[str, BindingType] = {}
+    '''
+        Analysis the fields of the dataclasses into the binding types.
+
+        Only the analysis of the field types is cached, the defaults (including
+        `default_factory` and the standard streams for the files) are resolved on
+        each call, so that every parser gets its own default values.
+
+        Parameters:
+        - clz (`Type[DataclassType]`):
+            The dataclasses to analysis, the non-dataclass types are ignored.
+
+        Returns:
+        - `Dict[str, BindingType]`
+            The binding types keyed by the field names.
+    '''
+    binding_types: Dict[str, BindingType] = {}
     for cls in clz:
         if not is_dataclass(cls):
             continue
-        for field in fields(cls):
-            res = analysis_filed(field)
+        hints = _type_hints(cls)
+        for field in dataclass_fields(cls):
+            field_type = hints.get(field.name)
+            if field_type is None and isinstance(field.type, str):
+                warnings.warn(
+                    f'The annotation "{field.type}" of "{field.name}" can not be resolved.',
+                    UserWarning
+                )
+            res = analysis_filed(field, field_type)
             if res:
-                types[field.name] = res
+                binding_types[res.name] = res
 
-    return types
+    return binding_types
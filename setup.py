@@ -4,7 +4,23 @@ Setup script.
 Authors: zipzou
 Date:    2024/01/08 11:18:27
 """
+import os
 
 import setuptools
 
-setuptools.setup()
+ext_modules = []
+# Set `PARSER_BINDING_CYTHON=1` to compile the modules with Cython, the
+# compiled extensions shadow the pure-Python sources which are kept as is.
+if os.environ.get('PARSER_BINDING_CYTHON', '').lower() in ('1', 'true', 'yes'):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            'parser_binding/parser.py',
+            'parser_binding/types.py',
+            'parser_binding/utils.py',
+        ],
+        language_level=3
+    )
+
+setuptools.setup(ext_modules=ext_modules)